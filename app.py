@@ -2,8 +2,10 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import os
-from employee_manager import EmployeeManager
-from task_matcher import TaskMatcher
+import pickle
+import time
+from datetime import datetime
+from performance_tracker import PerformanceTracker
 
 st.set_page_config(
     page_title="AI Task Assignment System",
@@ -11,72 +13,296 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state variables if they don't exist
-if 'employee_manager' not in st.session_state:
-    st.session_state.employee_manager = None
-if 'task_matcher' not in st.session_state:
-    st.session_state.task_matcher = None
-if 'data_loaded' not in st.session_state:
-    st.session_state.data_loaded = False
-if 'assigned_tasks' not in st.session_state:
-    st.session_state.assigned_tasks = []
-if 'completed_tasks' not in st.session_state:
-    st.session_state.completed_tasks = []
-if 'employee_performance' not in st.session_state:
-    st.session_state.employee_performance = {}
-if 'employee_preferences' not in st.session_state:
-    st.session_state.employee_preferences = {}
-if 'task_history' not in st.session_state:
-    st.session_state.task_history = {}
-if 'learned_preferences' not in st.session_state:
-    st.session_state.learned_preferences = False
-if 'task_to_reassign' not in st.session_state:
-    st.session_state.task_to_reassign = None
-if 'selected_employee_id' not in st.session_state:
-    st.session_state.selected_employee_id = None
-if 'selected_employee_name' not in st.session_state:
-    st.session_state.selected_employee_name = None
-if 'selected_task_details' not in st.session_state:
-    st.session_state.selected_task_details = {}
-
-def load_data():
-    """Load the employee dataset"""
+# Session state defaults, applied in one pass on every rerun.
+# assigned_tasks_by_id maps task_id -> task dict (same references as the
+# assigned_tasks entries); tasks_version is bumped on writes and used as a
+# cache key by the derived-view helpers. Employee views key on the shared
+# EmployeeManager's own version counter instead, since the manager (and
+# therefore its mutations) is shared by every session.
+_SESSION_DEFAULTS = {
+    'employee_manager': None,
+    'task_matcher': None,
+    'data_loaded': False,
+    'assigned_tasks': [],
+    'assigned_tasks_by_id': {},
+    'completed_tasks': [],
+    'employee_performance': PerformanceTracker(),
+    'employee_preferences': {},
+    'task_history': {},
+    'learned_preferences': False,
+    'task_to_reassign': None,
+    'tasks_version': 0,
+    'selected_employee_id': None,
+    'selected_employee_name': None,
+    'selected_task_details': {}
+}
+for _key, _value in _SESSION_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
+
+# Explicit dtypes so pandas skips type inference and repeated strings are
+# stored as compact categoricals instead of Python objects
+CSV_DTYPES = {
+    'ID': 'int32',
+    'Name': 'string',
+    'Role': 'category',
+    'Position': 'category',
+    'Experience': 'category',
+    'Skills': 'string'
+}
+
+# All availability levels an employee can move through; declared up front so
+# the categorical column never needs to grow new categories at runtime
+AVAILABILITY_LEVELS = ['Free', 'Partially Assigned', 'Fully Assigned']
+
+# Cell-style lookup table for the task history view; a dict lookup per cell
+# is much cheaper than the per-column list comprehensions it replaces
+PRIORITY_COLORS = {
+    'High': 'background-color: #FF8787',
+    'Medium': 'background-color: #FFD43B',
+    'Low': 'background-color: #8CE99A'
+}
+
+def priority_styles(s):
+    """Return the style strings for a whole Priority column in one
+    vectorized map instead of a per-cell function call"""
+    return s.map(PRIORITY_COLORS).fillna('')
+
+# Medal colors for the top three leaderboard ranks
+RANK_COLORS = {
+    1: 'background-color: gold',
+    2: 'background-color: silver',
+    3: 'background-color: #cd7f32'
+}
+
+def rank_styles(s):
+    """Style strings for the leaderboard Rank column"""
+    return s.map(RANK_COLORS).fillna('')
+
+# Columns shown in the employee table views
+EMPLOYEE_DISPLAY_COLS = ['ID', 'Name', 'Role', 'Position', 'Experience', 'Skills']
+
+# Pre-built emoji badge per availability level; since Availability is a
+# categorical, mapping touches only the three category values
+STATUS_BADGES = {
+    'Free': '🟢 Free',
+    'Partially Assigned': '🟡 Partially Assigned',
+    'Fully Assigned': '🔴 Fully Assigned'
+}
+
+def render_employee_table(employees):
+    """Render an employee DataFrame; shared by the skill-search and
+    all-employees tabs.
+
+    Uses Streamlit's native Arrow rendering instead of a pandas Styler:
+    the Styler serializes an HTML style per cell, which dominates render
+    time for larger tables, while a precomputed emoji badge column
+    encodes availability visually at no per-cell cost.
+    """
+    st.dataframe(
+        employees[EMPLOYEE_DISPLAY_COLS].assign(
+            Status=employees['Availability'].map(STATUS_BADGES)
+        ),
+        column_config={
+            'Status': st.column_config.TextColumn(
+                'Status', help="🟢 Free · 🟡 Partially Assigned · 🔴 Fully Assigned"
+            ),
+        },
+        hide_index=True
+    )
+
+def _read_dataset(csv_path):
+    """Read the dataset, keeping a Parquet sidecar as a conversion cache.
+
+    The first load parses the CSV and writes a .parquet file next to it;
+    later cold starts read the Parquet file directly, which skips text
+    parsing entirely. The sidecar is regenerated whenever the CSV is newer.
+    Falls back to plain CSV reading if pyarrow is unavailable.
+    """
+    parquet_path = csv_path.replace('.csv', '.parquet')
     try:
-        # Try to load from the attached_assets directory first (where it was uploaded)
-        if os.path.exists('attached_assets/employee_positions_dataset.csv'):
-            df = pd.read_csv('attached_assets/employee_positions_dataset.csv')
-            return df
-        # If not found, check in the current directory
-        elif os.path.exists('employee_positions_dataset.csv'):
-            df = pd.read_csv('employee_positions_dataset.csv')
-            return df
-        else:
+        if (os.path.exists(parquet_path)
+                and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+    except (ImportError, OSError, ValueError):
+        pass  # Unreadable or stale sidecar; fall through to the CSV
+
+    df = pd.read_csv(csv_path, dtype=CSV_DTYPES)
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow', index=False)
+    except (ImportError, OSError, ValueError):
+        pass  # pyarrow missing or directory read-only; CSV path still works
+    return df
+
+def _find_dataset_path():
+    """Locate the employee dataset CSV, preferring the uploaded copy"""
+    # Try the attached_assets directory first (where it was uploaded)
+    if os.path.exists('attached_assets/employee_positions_dataset.csv'):
+        return 'attached_assets/employee_positions_dataset.csv'
+    # If not found, check in the current directory
+    if os.path.exists('employee_positions_dataset.csv'):
+        return 'employee_positions_dataset.csv'
+    return None
+
+@st.cache_data(show_spinner=False)
+def load_data(csv_mtime=None):
+    """Load the employee dataset (cached so reruns skip the CSV parse).
+
+    csv_mtime is only part of the cache key: passing the dataset's current
+    mtime makes edits to the file invalidate the cached frame.
+    """
+    try:
+        csv_path = _find_dataset_path()
+        if csv_path is None:
             return None
+        return _read_dataset(csv_path)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
+# Bump whenever the managers' pickled attribute layout changes; a payload
+# carrying a different tag is rebuilt instead of loading and failing later
+# with an AttributeError at use time
+_MANAGERS_SCHEMA = 3
+
+def _managers_cache_path(csv_path):
+    """Path of the pickled-managers cache for the current dataset version"""
+    return os.path.join('.cache', f'managers_{int(os.path.getmtime(csv_path))}.pkl')
+
+@st.cache_resource(show_spinner=False)
+def build_managers():
+    """Construct the EmployeeManager and TaskMatcher once per server process.
+
+    The managers are shared across sessions and reruns, so the skill scans
+    and matcher setup run a single time instead of once per browser session.
+    A pickle keyed on the CSV mtime additionally lets a freshly started
+    process skip parsing and index building entirely.
+    """
+    csv_path = _find_dataset_path()
+    cache_path = _managers_cache_path(csv_path) if csv_path else None
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception:
+            payload = None  # Unreadable cache; rebuild from the dataset
+        if isinstance(payload, dict) and payload.get('schema') == _MANAGERS_SCHEMA:
+            employee_manager, task_matcher = payload['managers']
+            # The pickle predates any status changes; bring it up to date
+            # from the append-only journal
+            employee_manager.replay_journal()
+            return employee_manager, task_matcher
+        # Any other payload came from an older code revision; fall through
+        # and rebuild rather than trusting its attribute layout
+
+    df = load_data(os.path.getmtime(csv_path) if csv_path else None)
+    if df is None:
+        return None, None
+
+    # Deferred so the first paint isn't blocked by the matcher's sklearn
+    # import chain; by design this only runs once per process
+    from employee_manager import EmployeeManager
+    from task_matcher import TaskMatcher
+
+    # Add required columns if they don't exist, in one bulk assign
+    defaults = {
+        'Current_Tasks': '',
+        'Status_Emoji': '🟢',   # Default to free/green
+        'Task_Progress': 0      # Progress percentage from 0-100
+    }
+    missing = [col for col in defaults if col not in df.columns]
+    if missing:
+        df = df.assign(**{col: defaults[col] for col in missing})
+
+    # Availability always goes through the categorical constructor so every
+    # level is registered up front and status updates never upcast
+    if 'Availability' not in df.columns:
+        df['Availability'] = pd.Categorical(['Free'] * len(df), categories=AVAILABILITY_LEVELS)
+    else:
+        df['Availability'] = pd.Categorical(df['Availability'], categories=AVAILABILITY_LEVELS)
+
+    # Shrink the numeric columns; every later scan of the frame moves fewer
+    # bytes (ID fits in int32 and the progress percentage in int8)
+    df['ID'] = pd.to_numeric(df['ID'], downcast='integer')
+    df['Task_Progress'] = pd.to_numeric(df['Task_Progress'], downcast='integer')
+
+    employee_manager = EmployeeManager(df)
+    task_matcher = TaskMatcher(employee_manager)
+
+    if cache_path:
+        try:
+            os.makedirs('.cache', exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump({'schema': _MANAGERS_SCHEMA,
+                             'managers': (employee_manager, task_matcher)}, f)
+        except Exception:
+            pass  # Read-only filesystem etc.; the cache is best-effort
+
+    # Replay after the pickle dump so the snapshot stays journal-free and
+    # replaying on later loads never double-applies a delta
+    employee_manager.replay_journal()
+    return employee_manager, task_matcher
+
 def initialize_system():
     """Initialize the employee manager and task matcher"""
-    df = load_data()
-    if df is not None:
-        # Add required columns if they don't exist
-        if 'Availability' not in df.columns:
-            df['Availability'] = 'Free'
-        if 'Current_Tasks' not in df.columns:
-            df['Current_Tasks'] = ''
-        if 'Status_Emoji' not in df.columns:
-            df['Status_Emoji'] = '🟢'  # Default to free/green
-        if 'Task_Progress' not in df.columns:
-            df['Task_Progress'] = 0  # Progress percentage from 0-100
-        
-        # Initialize employee manager and task matcher
-        st.session_state.employee_manager = EmployeeManager(df)
-        st.session_state.task_matcher = TaskMatcher(st.session_state.employee_manager)
+    employee_manager, task_matcher = build_managers()
+    if employee_manager is not None:
+        st.session_state.employee_manager = employee_manager
+        st.session_state.task_matcher = task_matcher
+
+        # Compute widget option lists once; the roster is static for the
+        # session, so the per-rerun DataFrame scans are unnecessary
+        st.session_state.all_skills = employee_manager.get_all_skills()
+        st.session_state.all_roles = employee_manager.get_all_roles()
+        st.session_state.all_experience_levels = employee_manager.get_all_experience_levels()
+
+        _load_session_snapshot()
         st.session_state.data_loaded = True
         return True
     return False
 
+# Snapshot of the task and performance state, so it survives a server
+# restart instead of resetting every session
+_SNAPSHOT_PATH = os.path.join('.state', 'session.pkl')
+
+def _load_session_snapshot():
+    """Restore assigned tasks, performance metrics and preferences from
+    the on-disk snapshot, if one exists"""
+    if st.session_state.assigned_tasks or not os.path.exists(_SNAPSHOT_PATH):
+        return
+    try:
+        with open(_SNAPSHOT_PATH, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return  # Stale or incompatible snapshot; start fresh
+
+    st.session_state.assigned_tasks = snapshot.get('assigned_tasks', [])
+    st.session_state.assigned_tasks_by_id = {
+        task['task_id']: task for task in st.session_state.assigned_tasks
+    }
+    st.session_state.completed_tasks = snapshot.get('completed_tasks', [])
+    performance = snapshot.get('employee_performance')
+    if performance is not None:
+        st.session_state.employee_performance = performance
+    st.session_state.employee_preferences = snapshot.get('employee_preferences', {})
+    # learned_preferences stays False so the affinity analysis reruns over
+    # the restored history; the version bump invalidates any cached views
+    st.session_state.tasks_version += 1
+
+def _save_session_snapshot():
+    """Write the current task and performance state to disk, best-effort"""
+    try:
+        os.makedirs('.state', exist_ok=True)
+        with open(_SNAPSHOT_PATH, 'wb') as f:
+            pickle.dump({
+                'assigned_tasks': st.session_state.assigned_tasks,
+                'completed_tasks': st.session_state.completed_tasks,
+                'employee_performance': st.session_state.employee_performance,
+                'employee_preferences': st.session_state.employee_preferences
+            }, f)
+    except Exception:
+        pass  # Read-only filesystem etc.; persistence is best-effort
+
 # Main application
 st.title("AI Employee Task Assignment System")
 
@@ -89,38 +315,105 @@ if not st.session_state.data_loaded:
             st.error("Failed to load employee data. Please make sure the CSV file is in the correct location.")
 
 # Helper function to update employee performance metrics
-def update_employee_performance(employee_id, employee_name, task_priority, completion_time):
+def update_employee_performance(employee_id, employee_name, task_priority, completion_time, on_time):
     """Update employee performance metrics when a task is completed"""
-    if employee_id not in st.session_state.employee_performance:
-        st.session_state.employee_performance[employee_id] = {
-            'employee_id': employee_id,
-            'employee_name': employee_name,
-            'tasks_completed': 0,
-            'high_priority_completed': 0,
-            'medium_priority_completed': 0,
-            'low_priority_completed': 0,
-            'avg_completion_time': 0,
-            'total_completion_time': 0,
-            'on_time_completion_rate': 100.0,
-            'on_time_count': 0,
-            'late_count': 0
+    st.session_state.employee_performance.record_completion(
+        employee_id,
+        employee_name,
+        task_priority,
+        completion_time.total_seconds() / (60 * 60 * 24),  # Convert to days
+        on_time
+    )
+
+def mark_tasks_changed():
+    """Record that the assigned-tasks list was modified"""
+    st.session_state.tasks_version += 1
+    _save_session_snapshot()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_filtered_employees_cached(version, roles, experience_levels, availability_status):
+    """Filtered employee view, cached on the filter tuples so unrelated
+    widget interactions reuse the previous result. The version argument is
+    the shared manager's counter, so a status change made in any session
+    invalidates the entries for every session."""
+    return st.session_state.employee_manager.get_filtered_employees(
+        roles=list(roles) if roles else None,
+        experience_levels=list(experience_levels) if experience_levels else None,
+        availability_status=list(availability_status) if availability_status else None
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def find_employees_by_skills_cached(version, skills):
+    """Skill-search result, cached on the sorted skills tuple plus the
+    shared manager's version counter"""
+    return st.session_state.employee_manager.find_employees_by_skills(list(skills))
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def get_available_employees_cached(version):
+    """ID/Name view of employees who can take more work, for the
+    reassignment dropdown. Cached on the shared manager's version counter so the
+    isin filter doesn't rerun on every interaction while the reassign
+    panel is open."""
+    all_employees = st.session_state.employee_manager.get_all_employees()
+    mask = all_employees['Availability'].isin(['Free', 'Partially Assigned'])
+    return all_employees.loc[mask, ['ID', 'Name']]
+
+def _manual_preferences_key():
+    """Hashable snapshot of this session's manual preferences, so cached
+    match results are keyed on the preference content itself rather than a
+    per-session counter that collides across sessions"""
+    return tuple(sorted(
+        (employee_id, skill, level)
+        for employee_id, skills in st.session_state.employee_preferences.items()
+        for skill, level in skills.items()
+    ))
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def find_best_match_cached(version, matcher_version, task_description, skills,
+                           manual_preferences):
+    """Best-match result for a task, cached so re-submitting the same form
+    doesn't repeat the scoring pass. Invalidated by the shared manager's
+    version counter whenever availability changes and by the shared
+    matcher's whenever learned preferences change; manual preferences are
+    part of the key as a content tuple (see _manual_preferences_key)."""
+    preferences = {}
+    for employee_id, skill, level in manual_preferences:
+        preferences.setdefault(employee_id, {})[skill] = level
+    return st.session_state.task_matcher.find_best_match(
+        task_description, list(skills), consider_preferences=True,
+        manual_preferences=preferences or None
+    )
+
+def get_tasks_df():
+    """Return the assigned tasks as a DataFrame, rebuilding only when the
+    task list has actually changed since the last build"""
+    if st.session_state.get('tasks_df_version') != st.session_state.tasks_version:
+        tasks_df = pd.DataFrame(st.session_state.assigned_tasks)
+        # Epoch seconds -> local wall-clock for display; going through UTC
+        # keeps the conversion correct regardless of the server timezone
+        local_tz = datetime.now().astimezone().tzinfo
+        tasks_df['timestamp'] = (pd.to_datetime(tasks_df['timestamp'], unit='s', utc=True)
+                                 .dt.tz_convert(local_tz).dt.tz_localize(None))
+        # Tasks are appended in assignment order, so newest-first is just a
+        # reversed view; no sort needed
+        tasks_df = tasks_df.iloc[::-1].reset_index(drop=True)
+        if 'progress' not in tasks_df.columns:
+            tasks_df['progress'] = 0
+        # Three-valued string columns as categoricals: one byte per cell
+        # and integer codes for any later sort or comparison
+        tasks_df['priority'] = tasks_df['priority'].astype(
+            pd.CategoricalDtype(['Low', 'Medium', 'High'], ordered=True))
+        tasks_df['status'] = tasks_df['status'].astype(
+            pd.CategoricalDtype(['In Progress', 'Completed']))
+        st.session_state.tasks_df = tasks_df
+        # Positional index for O(1) row lookup by task name
+        st.session_state.task_row_by_name = {
+            name: pos for pos, name in enumerate(tasks_df['task_name'])
         }
-    
-    # Update metrics
-    perf = st.session_state.employee_performance[employee_id]
-    perf['tasks_completed'] += 1
-    
-    # Update priority counts
-    if task_priority == 'High':
-        perf['high_priority_completed'] += 1
-    elif task_priority == 'Medium':
-        perf['medium_priority_completed'] += 1
-    else:
-        perf['low_priority_completed'] += 1
-    
-    # Update completion time metrics
-    perf['total_completion_time'] += completion_time.total_seconds() / (60 * 60 * 24)  # Convert to days
-    perf['avg_completion_time'] = perf['total_completion_time'] / perf['tasks_completed']
+        # Selectbox options in display order, built once per version
+        st.session_state.task_names = list(st.session_state.task_row_by_name)
+        st.session_state.tasks_df_version = st.session_state.tasks_version
+    return st.session_state.tasks_df
 
 # If data is loaded, display the application interface
 # Function to update task matcher with learned preferences
@@ -141,653 +434,646 @@ def learn_employee_preferences():
     
     return False
 
-if st.session_state.data_loaded:
-    # Create tabs for different functionalities
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "Assign Task", 
-        "Search by Skills", 
-        "View All Employees", 
-        "View Assigned Tasks", 
-        "Performance Leaderboard",
-        "Employee Preferences"
-    ])
-    
-    # Try to learn preferences from completed tasks
-    preferences_learned = learn_employee_preferences()
+# Each tab body runs as a fragment, so a widget interaction inside one
+# tab reruns only that tab instead of the whole script
+@st.fragment
+def render_assign_tab():
+    """Tab 1: task entry form and assignment flow"""
+    st.header("Assign a Task")
+    st.write("Enter task details to find the best matching employee")
     
-    with tab1:
-        st.header("Assign a Task")
-        st.write("Enter task details to find the best matching employee")
+    # Task input form
+    with st.form(key="task_form"):
+        task_description = st.text_area("Task Description", placeholder="Describe the task requirements...")
+        required_skills = st.multiselect(
+            "Required Skills", 
+            options=st.session_state.all_skills, 
+            placeholder="Select required skills for this task"
+        )
+        task_priority = st.select_slider(
+            "Task Priority", 
+            options=["Low", "Medium", "High"]
+        )
+        task_name = st.text_input("Task Name", placeholder="Enter a name for this task")
+        task_deadline = st.date_input("Deadline", min_value=pd.Timestamp.now().date())
         
-        # Task input form
-        with st.form(key="task_form"):
-            task_description = st.text_area("Task Description", placeholder="Describe the task requirements...")
-            required_skills = st.multiselect(
-                "Required Skills", 
-                options=st.session_state.employee_manager.get_all_skills(), 
-                placeholder="Select required skills for this task"
-            )
-            task_priority = st.select_slider(
-                "Task Priority", 
-                options=["Low", "Medium", "High"]
-            )
-            task_name = st.text_input("Task Name", placeholder="Enter a name for this task")
-            task_deadline = st.date_input("Deadline", min_value=pd.Timestamp.now().date())
-            
-            # Store selected employee in session state for post-form processing
-            if 'selected_employee_id' not in st.session_state:
-                st.session_state.selected_employee_id = None
-            if 'selected_employee_name' not in st.session_state:
-                st.session_state.selected_employee_name = None
-            if 'selected_task_details' not in st.session_state:
-                st.session_state.selected_task_details = {}
-                
-            submit_button = st.form_submit_button(label="Find Best Match")
+        # Store selected employee in session state for post-form processing
+        if 'selected_employee_id' not in st.session_state:
+            st.session_state.selected_employee_id = None
+        if 'selected_employee_name' not in st.session_state:
+            st.session_state.selected_employee_name = None
+        if 'selected_task_details' not in st.session_state:
+            st.session_state.selected_task_details = {}
             
-            if submit_button:
-                if not task_description:
-                    st.error("Please provide a task description")
-                elif not required_skills:
-                    st.error("Please select at least one required skill")
-                elif not task_name:
-                    st.error("Please provide a task name")
-                else:
-                    # Try to find a matching employee
-                    # Pass manual preferences if available
-                    best_match = st.session_state.task_matcher.find_best_match(
-                        task_description, 
-                        required_skills,
-                        consider_preferences=True
-                    )
-                    
-                    # Update find_best_match implementation to use manual preferences
-                    if 'get_preference_score' in dir(st.session_state.task_matcher):
-                        # Get a reference to the original method
-                        original_method = st.session_state.task_matcher.get_preference_score
-                        
-                        # Define a wrapper that passes session state preferences
-                        def wrapped_preference_score(employee_id, required_skills, task_description, manual_preferences=None):
-                            return original_method(
-                                employee_id, 
-                                required_skills, 
-                                task_description, 
-                                manual_preferences=st.session_state.employee_preferences
-                            )
-                        
-                        # Replace the method temporarily for this call
-                        st.session_state.task_matcher.get_preference_score = wrapped_preference_score
-                        
-                        # Try to find a match again with the enhanced method
-                        best_match = st.session_state.task_matcher.find_best_match(
-                            task_description, 
-                            required_skills,
-                            consider_preferences=True
-                        )
-                        
-                        # Restore the original method
-                        st.session_state.task_matcher.get_preference_score = original_method
-                    
-                    if best_match:
-                        employee_id, employee_name, match_score = best_match
-                        st.success(f"Best match found: {employee_name} (ID: {employee_id}) with a match score of {match_score:.2f}")
-                        
-                        # Store selected employee and task details in session state
-                        st.session_state.selected_employee_id = employee_id
-                        st.session_state.selected_employee_name = employee_name
-                        st.session_state.selected_task_details = {
-                            'task_name': task_name,
-                            'task_description': task_description,
-                            'task_priority': task_priority,
-                            'task_deadline': task_deadline
-                        }
-                        
-                        # Display employee details
-                        employee_details = st.session_state.employee_manager.get_employee_by_id(employee_id)
-                        if employee_details is not None:
-                            st.write(f"**Role:** {employee_details['Role']}")
-                            st.write(f"**Position:** {employee_details['Position']}")
-                            st.write(f"**Experience Level:** {employee_details['Experience']}")
-                            st.write(f"**Skills:** {employee_details['Skills']}")
-                            st.write(f"**Current Availability:** {employee_details['Availability']}")
-                    else:
-                        st.warning("No suitable employee found for this task with the required skills.")
+        submit_button = st.form_submit_button(label="Find Best Match")
         
-        # Add task assignment button outside the form
-        if st.session_state.selected_employee_id is not None:
-            # Create a container for the assignment button
-            assign_container = st.container()
-            with assign_container:
-                if st.button("Assign Task to This Employee"):
-                    employee_id = st.session_state.selected_employee_id
-                    employee_name = st.session_state.selected_employee_name
-                    task_details = st.session_state.selected_task_details
+        if submit_button:
+            if not task_description:
+                st.error("Please provide a task description")
+            elif not required_skills:
+                st.error("Please select at least one required skill")
+            elif not task_name:
+                st.error("Please provide a task name")
+            else:
+                # Try to find a matching employee; manual preferences are
+                # passed straight through to the scoring pass
+                best_match = find_best_match_cached(
+                    st.session_state.employee_manager.version,
+                    st.session_state.task_matcher.version,
+                    task_description,
+                    tuple(sorted(required_skills)),
+                    _manual_preferences_key()
+                )
+
+                if best_match:
+                    employee_id, employee_name, match_score = best_match
+                    st.success(f"Best match found: {employee_name} (ID: {employee_id}) with a match score of {match_score:.2f}")
                     
-                    success = st.session_state.task_matcher.assign_task(
-                        employee_id, 
-                        task_details['task_name'], 
-                        task_details['task_description'], 
-                        task_details['task_priority']
-                    )
+                    # Store selected employee and task details in session state
+                    st.session_state.selected_employee_id = employee_id
+                    st.session_state.selected_employee_name = employee_name
+                    st.session_state.selected_task_details = {
+                        'task_name': task_name,
+                        'task_description': task_description,
+                        'task_priority': task_priority,
+                        'task_deadline': task_deadline
+                    }
                     
-                    if success:
-                        # Add to assigned tasks in session state
-                        task_id = len(st.session_state.assigned_tasks) + 1
-                        st.session_state.assigned_tasks.append({
-                            'task_id': task_id,
-                            'employee_id': employee_id,
-                            'employee_name': employee_name,
-                            'task_name': task_details['task_name'],
-                            'task_description': task_details['task_description'],
-                            'required_skills': required_skills,
-                            'priority': task_details['task_priority'],
-                            'deadline': task_details['task_deadline'],
-                            'timestamp': pd.Timestamp.now(),
-                            'status': 'In Progress'
-                        })
-                        st.success(f"Task '{task_details['task_name']}' successfully assigned to {employee_name}!")
-                        
-                        # Reset the selected employee
-                        st.session_state.selected_employee_id = None
-                        st.session_state.selected_employee_name = None
-                        st.session_state.selected_task_details = {}
-                        
-                        # Force a rerun to update the interface
-                        st.rerun()
-                    else:
-                        st.error("Failed to assign task. Employee may be fully assigned.")
+                    # Display employee details
+                    employee_details = st.session_state.employee_manager.get_employee_by_id(employee_id)
+                    if employee_details is not None:
+                        st.write(f"**Role:** {employee_details['Role']}")
+                        st.write(f"**Position:** {employee_details['Position']}")
+                        st.write(f"**Experience Level:** {employee_details['Experience']}")
+                        st.write(f"**Skills:** {employee_details['Skills']}")
+                        st.write(f"**Current Availability:** {employee_details['Availability']}")
+                else:
+                    st.warning("No suitable employee found for this task with the required skills.")
     
-    with tab2:
-        st.header("Search Employees by Skills")
-        
-        # Skill search form
-        search_skills = st.multiselect(
-            "Select Skills to Search",
-            options=st.session_state.employee_manager.get_all_skills(),
-            placeholder="Select one or more skills"
-        )
-        
-        if search_skills:
-            matching_employees = st.session_state.employee_manager.find_employees_by_skills(search_skills)
-            
-            if not matching_employees.empty:
-                st.success(f"Found {len(matching_employees)} employees with the selected skills")
-                
-                # Display employees in a dataframe with color coding for availability
-                def highlight_availability(s):
-                    return ['background-color: #8CE99A' if val == 'Free' 
-                           else 'background-color: #FFD43B' if val == 'Partially Assigned'
-                           else 'background-color: #FF8787' for val in s]
+    # Add task assignment button outside the form
+    if st.session_state.selected_employee_id is not None:
+        # Create a container for the assignment button
+        assign_container = st.container()
+        with assign_container:
+            if st.button("Assign Task to This Employee"):
+                employee_id = st.session_state.selected_employee_id
+                employee_name = st.session_state.selected_employee_name
+                task_details = st.session_state.selected_task_details
                 
-                # Select columns to display
-                display_cols = ['ID', 'Name', 'Role', 'Position', 'Experience', 'Skills', 'Status_Emoji', 'Availability']
-                
-                # Prepare the dataframe with status emojis
-                display_df = matching_employees[display_cols].copy()
+                success = st.session_state.task_matcher.assign_task(
+                    employee_id, 
+                    task_details['task_name'], 
+                    task_details['task_description'], 
+                    task_details['task_priority']
+                )
                 
-                st.dataframe(display_df.style.apply(
-                    highlight_availability, subset=['Availability']
-                ))
-            else:
-                st.warning("No employees found with the selected skills.")
+                if success:
+                    # Add to assigned tasks in session state
+                    task_id = len(st.session_state.assigned_tasks) + 1
+                    st.session_state.assigned_tasks.append({
+                        'task_id': task_id,
+                        'employee_id': employee_id,
+                        'employee_name': employee_name,
+                        'task_name': task_details['task_name'],
+                        'task_description': task_details['task_description'],
+                        'required_skills': required_skills,
+                        'priority': task_details['task_priority'],
+                        'deadline': task_details['task_deadline'],
+                        # Plain epoch seconds; cheaper to store than a
+                        # pandas Timestamp and converted once at display
+                        'timestamp': time.time(),
+                        'status': 'In Progress'
+                    })
+                    # Register the same dict in the id index for O(1) lookup
+                    st.session_state.assigned_tasks_by_id[task_id] = st.session_state.assigned_tasks[-1]
+                    mark_tasks_changed()
+                    st.success(f"Task '{task_details['task_name']}' successfully assigned to {employee_name}!")
+                    
+                    # Reset the selected employee
+                    st.session_state.selected_employee_id = None
+                    st.session_state.selected_employee_name = None
+                    st.session_state.selected_task_details = {}
+                    
+                    # Force a rerun to update the interface
+                    st.rerun()
+                else:
+                    st.error("Failed to assign task. Employee may be fully assigned.")
+
+@st.fragment
+def render_skill_search_tab():
+    """Tab 2: search employees by skills"""
+    st.header("Search Employees by Skills")
     
-    with tab3:
-        st.header("All Employees")
-        
-        # Display filter options
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            filter_role = st.multiselect(
-                "Filter by Role",
-                options=st.session_state.employee_manager.get_all_roles(),
-                placeholder="Select roles"
-            )
-        with col2:
-            filter_experience = st.multiselect(
-                "Filter by Experience",
-                options=st.session_state.employee_manager.get_all_experience_levels(),
-                placeholder="Select experience levels"
-            )
-        with col3:
-            filter_availability = st.multiselect(
-                "Filter by Availability",
-                options=['Free', 'Partially Assigned', 'Fully Assigned'],
-                placeholder="Select availability status"
-            )
-        
-        # Get filtered employees
-        filtered_employees = st.session_state.employee_manager.get_filtered_employees(
-            roles=filter_role if filter_role else None,
-            experience_levels=filter_experience if filter_experience else None,
-            availability_status=filter_availability if filter_availability else None
+    # Skill search form
+    search_skills = st.multiselect(
+        "Select Skills to Search",
+        options=st.session_state.all_skills,
+        placeholder="Select one or more skills"
+    )
+    
+    if search_skills:
+        matching_employees = find_employees_by_skills_cached(
+            st.session_state.employee_manager.version, tuple(sorted(search_skills))
         )
         
-        # Display employees
-        if not filtered_employees.empty:
-            st.write(f"Showing {len(filtered_employees)} employees")
-            
-            # Function to highlight availability
-            def highlight_availability(s):
-                return ['background-color: #8CE99A' if val == 'Free' 
-                       else 'background-color: #FFD43B' if val == 'Partially Assigned'
-                       else 'background-color: #FF8787' for val in s]
-            
-            # Select columns to display
-            display_cols = ['ID', 'Name', 'Role', 'Position', 'Experience', 'Skills', 'Status_Emoji', 'Availability']
-            
-            # Prepare the dataframe with status emojis
-            display_df = filtered_employees[display_cols].copy()
+        if not matching_employees.empty:
+            st.success(f"Found {len(matching_employees)} employees with the selected skills")
             
-            st.dataframe(display_df.style.apply(
-                highlight_availability, subset=['Availability']
-            ))
+            render_employee_table(matching_employees)
         else:
-            st.warning("No employees match the selected filters.")
+            st.warning("No employees found with the selected skills.")
+
+@st.fragment
+def render_all_employees_tab():
+    """Tab 3: filterable view of all employees"""
+    st.header("All Employees")
     
-    with tab4:
-        st.header("Task Assignment History")
+    # Display filter options
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        filter_role = st.multiselect(
+            "Filter by Role",
+            options=st.session_state.all_roles,
+            placeholder="Select roles"
+        )
+    with col2:
+        filter_experience = st.multiselect(
+            "Filter by Experience",
+            options=st.session_state.all_experience_levels,
+            placeholder="Select experience levels"
+        )
+    with col3:
+        filter_availability = st.multiselect(
+            "Filter by Availability",
+            options=['Free', 'Partially Assigned', 'Fully Assigned'],
+            placeholder="Select availability status"
+        )
+    
+    # Get filtered employees
+    filtered_employees = get_filtered_employees_cached(
+        st.session_state.employee_manager.version,
+        tuple(sorted(filter_role)) if filter_role else None,
+        tuple(sorted(filter_experience)) if filter_experience else None,
+        tuple(sorted(filter_availability)) if filter_availability else None
+    )
+    
+    # Display employees
+    if not filtered_employees.empty:
+        st.write(f"Showing {len(filtered_employees)} employees")
         
-        if st.session_state.assigned_tasks:
-            # Convert assigned tasks to DataFrame for display
-            tasks_df = pd.DataFrame(st.session_state.assigned_tasks)
-            tasks_df['timestamp'] = pd.to_datetime(tasks_df['timestamp'])
-            tasks_df = tasks_df.sort_values('timestamp', ascending=False)
-            
-            # Add progress column if not exists
-            if 'progress' not in tasks_df.columns:
-                tasks_df['progress'] = 0
+        render_employee_table(filtered_employees)
+    else:
+        st.warning("No employees match the selected filters.")
+
+@st.fragment
+def render_task_detail_panel(task_to_view):
+    """Detail panel for one task: progress, completion and reassignment.
+
+    Runs as its own nested fragment so a slider drag reruns only this
+    panel; completion and reassignment still trigger a full-app rerun
+    because they change what the other tabs display."""
+    tasks_df = get_tasks_df()
+    task_details = tasks_df.iloc[st.session_state.task_row_by_name[task_to_view]]
+    task_id = task_details['task_id']
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.subheader(f"Task: {task_details['task_name']}")
+        st.write(f"**Assigned to:** {task_details['employee_name']}")
+        st.write(f"**Priority:** {task_details['priority']}")
+        st.write(f"**Deadline:** {task_details['deadline'].strftime('%Y-%m-%d')}")
+        st.write(f"**Assigned at:** {task_details['timestamp']}")
+        st.write(f"**Status:** {task_details['status']}")
+        st.write("**Description:**")
+        st.write(task_details['task_description'])
+    
+    # Add task progress and completion buttons for in-progress tasks
+    with col2:
+        if task_details['status'] == 'In Progress':
+            # Add progress slider
+            if 'progress' not in task_details:
+                task_progress = 0
+            else:
+                task_progress = task_details['progress']
                 
-            # Format for display
-            display_tasks = tasks_df[['employee_name', 'task_name', 'priority', 'deadline', 'timestamp', 'status', 'progress']]
-            display_tasks.columns = ['Employee', 'Task', 'Priority', 'Deadline', 'Assigned At', 'Status', 'Progress (%)']
+            new_progress = st.slider(
+                "Task Progress",
+                min_value=0,
+                max_value=100,
+                value=int(task_progress),
+                key=f"progress_{task_id}"
+            )
             
-            # Apply styling based on priority
-            def highlight_priority(s):
-                return ['background-color: #FF8787' if val == 'High'
-                       else 'background-color: #FFD43B' if val == 'Medium'
-                       else 'background-color: #8CE99A' for val in s]
+            # Update progress if changed
+            if new_progress != task_progress:
+                task = st.session_state.assigned_tasks_by_id.get(task_id)
+
+                if task is not None:
+                    task['progress'] = new_progress
+                    mark_tasks_changed()
+
+                    # Update employee status based on progress
+                    employee_status = 'Partially Assigned'
+                    if new_progress > 75:
+                        employee_status = 'Fully Assigned'  # Almost done but still busy
+                    elif new_progress < 25:
+                        employee_status = 'Partially Assigned'  # Just started
+                    
+                    # Update employee status
+                    st.session_state.employee_manager.update_employee_availability(
+                        task_details['employee_id'],
+                        employee_status
+                    )
+
+                    st.success(f"Progress updated to {new_progress}%")
+                    # A progress change only affects this panel directly;
+                    # the version counters refresh the wider views on the
+                    # next full rerun. Fragment scope is only legal during
+                    # a fragment rerun, so fall back to the default app
+                    # scope when this branch runs in a full script run
+                    # (e.g. stored progress changed outside the slider)
+                    try:
+                        st.rerun(scope="fragment")
+                    except st.errors.StreamlitAPIException:
+                        st.rerun()
             
-            st.dataframe(display_tasks.style.apply(
-                highlight_priority, subset=['Priority']
-            ))
+            if st.button(f"Mark as Completed", key=f"complete_{task_id}"):
+                task = st.session_state.assigned_tasks_by_id.get(task_id)
+
+                if task is not None:
+                    # Update task status; one epoch instant feeds the stored
+                    # completion time, the elapsed delta and the on-time
+                    # check, so no naive-local/naive-UTC mixing can skew them
+                    completion_ts = time.time()
+                    task['status'] = 'Completed'
+                    task['completion_time'] = completion_ts
+                    mark_tasks_changed()
+
+                    # Elapsed time straight from the raw epoch timestamps
+                    time_taken = pd.Timedelta(seconds=completion_ts - task['timestamp'])
+
+                    # Check if completed on time; the deadline is a local
+                    # calendar date, so compare in local wall-clock terms
+                    deadline = pd.Timestamp(task_details['deadline'])
+                    on_time = pd.Timestamp.fromtimestamp(completion_ts) <= deadline
+                    
+                    # Update employee status to completed for this task
+                    st.session_state.employee_manager.update_employee_task_status(
+                        task_details['employee_id'],
+                        task_id,
+                        'Completed',
+                        keep_assigned=False  # Free up the employee if no other tasks
+                    )
+
+                    # Update employee performance metrics, including
+                    # the on-time completion counters
+                    update_employee_performance(
+                        task_details['employee_id'],
+                        task_details['employee_name'],
+                        task_details['priority'],
+                        time_taken,
+                        on_time
+                    )
+
+                    st.success(f"Task marked as completed! Employee status updated. ✅")
+                    st.rerun()
+        elif task_details['status'] == 'In Progress':
+            # Add reassign button
+            if st.button("Reassign Task", key=f"reassign_{task_id}"):
+                st.session_state.task_to_reassign = task_id
+                st.rerun()
+        
+        # Handle reassignment if a task is selected for reassignment
+        if 'task_to_reassign' in st.session_state and st.session_state.task_to_reassign == task_id:
+            st.subheader("Reassign Task")
             
-            # Option to view task details
-            task_to_view = st.selectbox("Select a task to view details", 
-                                        options=tasks_df['task_name'].tolist(),
-                                        index=None,
-                                        placeholder="Choose a task...")
+            # Employees who can take more work, cached on the
+            # employee version counter
+            available_employees = get_available_employees_cached(
+                st.session_state.employee_manager.version
+            )
             
-            if task_to_view:
-                task_details = tasks_df[tasks_df['task_name'] == task_to_view].iloc[0]
-                task_id = task_details['task_id']
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.subheader(f"Task: {task_details['task_name']}")
-                    st.write(f"**Assigned to:** {task_details['employee_name']}")
-                    st.write(f"**Priority:** {task_details['priority']}")
-                    st.write(f"**Deadline:** {task_details['deadline'].strftime('%Y-%m-%d')}")
-                    st.write(f"**Assigned at:** {task_details['timestamp']}")
-                    st.write(f"**Status:** {task_details['status']}")
-                    st.write("**Description:**")
-                    st.write(task_details['task_description'])
-                
-                # Add task progress and completion buttons for in-progress tasks
-                with col2:
-                    if task_details['status'] == 'In Progress':
-                        # Add progress slider
-                        if 'progress' not in task_details:
-                            task_progress = 0
-                        else:
-                            task_progress = task_details['progress']
-                            
-                        new_progress = st.slider(
-                            "Task Progress",
-                            min_value=0,
-                            max_value=100,
-                            value=int(task_progress),
-                            key=f"progress_{task_id}"
-                        )
-                        
-                        # Update progress if changed
-                        if new_progress != task_progress:
-                            # Get task index
-                            task_idx = next((i for i, task in enumerate(st.session_state.assigned_tasks) 
-                                          if task['task_id'] == task_id), None)
-                            
-                            if task_idx is not None:
-                                st.session_state.assigned_tasks[task_idx]['progress'] = new_progress
-                                
-                                # Update employee status based on progress
-                                employee_status = 'Partially Assigned'
-                                if new_progress > 75:
-                                    employee_status = 'Fully Assigned'  # Almost done but still busy
-                                elif new_progress < 25:
-                                    employee_status = 'Partially Assigned'  # Just started
-                                
-                                # Update employee status
-                                st.session_state.employee_manager.update_employee_availability(
-                                    task_details['employee_id'],
-                                    employee_status
-                                )
-                                
-                                st.success(f"Progress updated to {new_progress}%")
-                                st.rerun()
-                        
-                        if st.button(f"Mark as Completed", key=f"complete_{task_id}"):
-                            # Get task index
-                            task_idx = next((i for i, task in enumerate(st.session_state.assigned_tasks) 
-                                           if task['task_id'] == task_id), None)
-                            
-                            if task_idx is not None:
-                                # Update task status
-                                st.session_state.assigned_tasks[task_idx]['status'] = 'Completed'
-                                st.session_state.assigned_tasks[task_idx]['completion_time'] = pd.Timestamp.now()
-                                
-                                # Calculate completion time
-                                assigned_time = task_details['timestamp']
-                                completion_time = pd.Timestamp.now()
-                                time_taken = completion_time - assigned_time
-                                
-                                # Check if completed on time
-                                deadline = pd.Timestamp(task_details['deadline'])
-                                on_time = completion_time <= deadline
-                                
-                                # Update employee status to completed for this task
-                                st.session_state.employee_manager.update_employee_task_status(
-                                    task_details['employee_id'],
-                                    task_id,
-                                    'Completed',
-                                    keep_assigned=False  # Free up the employee if no other tasks
-                                )
-                                
-                                # Update employee performance metrics
-                                update_employee_performance(
-                                    task_details['employee_id'],
-                                    task_details['employee_name'],
-                                    task_details['priority'],
-                                    time_taken
-                                )
-                                
-                                # Update on-time completion rate
-                                if task_details['employee_id'] in st.session_state.employee_performance:
-                                    perf = st.session_state.employee_performance[task_details['employee_id']]
-                                    if on_time:
-                                        perf['on_time_count'] += 1
-                                    else:
-                                        perf['late_count'] += 1
-                                    
-                                    total_completed = perf['on_time_count'] + perf['late_count']
-                                    if total_completed > 0:
-                                        perf['on_time_completion_rate'] = (perf['on_time_count'] / total_completed) * 100
-                                
-                                st.success(f"Task marked as completed! Employee status updated. ✅")
-                                st.rerun()
-                    elif task_details['status'] == 'In Progress':
-                        # Add reassign button
-                        if st.button("Reassign Task", key=f"reassign_{task_id}"):
-                            st.session_state.task_to_reassign = task_id
-                            st.rerun()
+            if not available_employees.empty:
+                # Name -> ID map doubles as the (ordered) dropdown options
+                emp_name_to_id = dict(zip(available_employees['Name'],
+                                          available_employees['ID']))
+
+                new_employee = st.selectbox(
+                    "Select New Employee",
+                    options=emp_name_to_id,
+                    index=None,
+                    placeholder="Choose an employee..."
+                )
+
+                if new_employee and st.button("Confirm Reassignment"):
+                    # Get the new employee ID
+                    new_emp_id = emp_name_to_id[new_employee]
                     
-                    # Handle reassignment if a task is selected for reassignment
-                    if 'task_to_reassign' in st.session_state and st.session_state.task_to_reassign == task_id:
-                        st.subheader("Reassign Task")
+                    task = st.session_state.assigned_tasks_by_id.get(task_id)
+
+                    if task is not None:
+                        # Update employee ID and name in task
+                        task['employee_id'] = new_emp_id
+                        task['employee_name'] = new_employee
+
+                        # Reset progress if there was any
+                        task['progress'] = 0
+                        mark_tasks_changed()
+
+                        # Update old employee's status (free them up)
+                        st.session_state.employee_manager.update_employee_task_status(
+                            task_details['employee_id'],
+                            task_id,
+                            'Reassigned',
+                            keep_assigned=False
+                        )
                         
-                        # Get all available employees
-                        all_employees = st.session_state.employee_manager.get_all_employees()
-                        # Filter to only show Free or Partially Assigned employees
-                        available_employees = all_employees[all_employees['Availability'].isin(['Free', 'Partially Assigned'])]
+                        # Update new employee's status
+                        st.session_state.employee_manager.update_employee_availability(
+                            new_emp_id,
+                            'Partially Assigned',
+                            task_name=task_details['task_name']
+                        )
+
+                        # Clear reassignment state
+                        st.session_state.task_to_reassign = None
                         
-                        if not available_employees.empty:
-                            # Create dropdown to select new employee
-                            emp_names = available_employees['Name'].tolist()
-                            emp_ids = available_employees['ID'].tolist()
-                            
-                            new_employee = st.selectbox(
-                                "Select New Employee", 
-                                options=emp_names,
-                                index=None,
-                                placeholder="Choose an employee..."
-                            )
-                            
-                            if new_employee and st.button("Confirm Reassignment"):
-                                # Get the new employee ID
-                                new_emp_id = emp_ids[emp_names.index(new_employee)]
-                                
-                                # Get task index
-                                task_idx = next((i for i, task in enumerate(st.session_state.assigned_tasks) 
-                                             if task['task_id'] == task_id), None)
-                                
-                                if task_idx is not None:
-                                    # Update employee ID and name in task
-                                    st.session_state.assigned_tasks[task_idx]['employee_id'] = new_emp_id
-                                    st.session_state.assigned_tasks[task_idx]['employee_name'] = new_employee
-                                    
-                                    # Reset progress if there was any
-                                    st.session_state.assigned_tasks[task_idx]['progress'] = 0
-                                    
-                                    # Update old employee's status (free them up)
-                                    st.session_state.employee_manager.update_employee_task_status(
-                                        task_details['employee_id'],
-                                        task_id,
-                                        'Reassigned',
-                                        keep_assigned=False
-                                    )
-                                    
-                                    # Update new employee's status
-                                    st.session_state.employee_manager.update_employee_availability(
-                                        new_emp_id,
-                                        'Partially Assigned',
-                                        task_name=task_details['task_name']
-                                    )
-                                    
-                                    # Clear reassignment state
-                                    st.session_state.task_to_reassign = None
-                                    
-                                    st.success(f"Task reassigned to {new_employee}!")
-                                    st.rerun()
-                        else:
-                            st.warning("No available employees found for reassignment.")
-                            
-                            # Add option to cancel reassignment
-                            if st.button("Cancel Reassignment"):
-                                st.session_state.task_to_reassign = None
-                                st.rerun()
-        else:
-            st.info("No tasks have been assigned yet.")
+                        st.success(f"Task reassigned to {new_employee}!")
+                        st.rerun()
+            else:
+                st.warning("No available employees found for reassignment.")
+                
+                # Add option to cancel reassignment
+                if st.button("Cancel Reassignment"):
+                    st.session_state.task_to_reassign = None
+                    st.rerun()
 
-    with tab5:
-        st.header("Performance Leaderboard")
+@st.fragment
+def render_assigned_tasks_tab():
+    """Tab 4: task history, progress, completion and reassignment"""
+    st.header("Task Assignment History")
+    
+    if st.session_state.assigned_tasks:
+        # Reuses the cached DataFrame unless tasks changed since last build
+        tasks_df = get_tasks_df()
+
+        # Format for display
+        display_tasks = tasks_df[['employee_name', 'task_name', 'priority', 'deadline', 'timestamp', 'status', 'progress']]
+        display_tasks.columns = ['Employee', 'Task', 'Priority', 'Deadline', 'Assigned At', 'Status', 'Progress (%)']
         
-        if st.session_state.employee_performance:
-            # Convert the performance data to a DataFrame
-            performance_data = list(st.session_state.employee_performance.values())
-            perf_df = pd.DataFrame(performance_data)
-            
-            # Create a scoring system
-            perf_df['performance_score'] = (
-                (perf_df['tasks_completed'] * 10) + 
-                (perf_df['high_priority_completed'] * 5) + 
-                (perf_df['medium_priority_completed'] * 3) + 
-                (perf_df['low_priority_completed'] * 1) -
-                (perf_df['avg_completion_time'] * 2) +
-                (perf_df['on_time_completion_rate'] * 0.5)
-            )
-            
-            # Sort by performance score (descending)
-            perf_df = perf_df.sort_values('performance_score', ascending=False)
-            
-            # Add rank column
-            perf_df['rank'] = range(1, len(perf_df) + 1)
-            
-            # Format for display
-            display_cols = [
-                'rank', 'employee_name', 'tasks_completed', 
-                'high_priority_completed', 'medium_priority_completed', 'low_priority_completed',
-                'avg_completion_time', 'on_time_completion_rate', 'performance_score'
-            ]
-            
-            display_df = perf_df[display_cols].copy()
-            
-            # Rename columns for display
-            display_df.columns = [
-                'Rank', 'Employee', 'Tasks Completed', 
-                'High Priority', 'Medium Priority', 'Low Priority',
-                'Avg. Completion Time (days)', 'On-time Rate (%)', 'Performance Score'
-            ]
-            
-            # Round numeric columns
-            display_df['Avg. Completion Time (days)'] = display_df['Avg. Completion Time (days)'].round(2)
-            display_df['On-time Rate (%)'] = display_df['On-time Rate (%)'].round(1)
-            display_df['Performance Score'] = display_df['Performance Score'].round(1)
-            
-            # Display top performers with highlighting
-            st.subheader("Employee Rankings")
-            st.write("Employees are ranked based on a performance score that considers task completion, task priority, completion time, and timeliness.")
-            
-            # Function to highlight top performers
-            def highlight_top_ranks(s):
-                is_rank = s.name == 'Rank'
-                return ['background-color: gold' if is_rank and val == 1
-                        else 'background-color: silver' if is_rank and val == 2
-                        else 'background-color: #cd7f32' if is_rank and val == 3
-                        else '' for val in s]
+        # Apply styling based on priority
+        st.dataframe(display_tasks.style.apply(
+            priority_styles, subset=['Priority']
+        ))
+        
+        # Option to view task details
+        task_to_view = st.selectbox("Select a task to view details",
+                                    options=st.session_state.task_names,
+                                    index=None,
+                                    placeholder="Choose a task...")
+        
+        if task_to_view:
+            render_task_detail_panel(task_to_view)
+    else:
+        st.info("No tasks have been assigned yet.")
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_leaderboard_cached(metrics_key):
+    """Ranked leaderboard frames, cached on a digest of the performance
+    tracker's metrics so reruns without a new completion reuse them.
+    Keying on content rather than a per-session counter means sessions
+    whose trackers diverge can never collide on a cache entry.
+    Returns the ranked metrics frame and the formatted display frame."""
+    # The tracker already keeps the metrics as contiguous arrays; this
+    # just wraps them with the derived columns for display
+    perf_df = st.session_state.employee_performance.to_dataframe()
+
+    # Create a scoring system: one fused NumPy expression over the
+    # metric columns instead of six chained pandas operations
+    n = len(perf_df)
+    scores = (perf_df['tasks_completed'].to_numpy() * 10.0
+              + perf_df['high_priority_completed'].to_numpy() * 5
+              + perf_df['medium_priority_completed'].to_numpy() * 3
+              + perf_df['low_priority_completed'].to_numpy()
+              - perf_df['avg_completion_time'].to_numpy() * 2
+              + perf_df['on_time_completion_rate'].to_numpy() * 0.5)
+
+    # Sort by performance score (descending) and rank via argsort
+    order = np.argsort(-scores)
+    perf_df = perf_df.iloc[order].reset_index(drop=True)
+    perf_df['performance_score'] = scores[order]
+    perf_df['rank'] = np.arange(1, n + 1)
+
+    # Format for display
+    display_cols = [
+        'rank', 'employee_name', 'tasks_completed',
+        'high_priority_completed', 'medium_priority_completed', 'low_priority_completed',
+        'avg_completion_time', 'on_time_completion_rate', 'performance_score'
+    ]
+
+    # Column selection already yields an independent frame under
+    # copy-on-write, so no explicit deep copy is needed
+    display_df = perf_df[display_cols]
+
+    # Rename columns for display
+    display_df.columns = [
+        'Rank', 'Employee', 'Tasks Completed',
+        'High Priority', 'Medium Priority', 'Low Priority',
+        'Avg. Completion Time (days)', 'On-time Rate (%)', 'Performance Score'
+    ]
+
+    # Round numeric columns
+    display_df['Avg. Completion Time (days)'] = display_df['Avg. Completion Time (days)'].round(2)
+    display_df['On-time Rate (%)'] = display_df['On-time Rate (%)'].round(1)
+    display_df['Performance Score'] = display_df['Performance Score'].round(1)
+
+    return perf_df, display_df
+
+@st.fragment
+def render_leaderboard_tab():
+    """Tab 5: performance leaderboard"""
+    st.header("Performance Leaderboard")
+
+    if st.session_state.employee_performance:
+        perf_df, display_df = build_leaderboard_cached(
+            st.session_state.employee_performance.state_key()
+        )
+
+        # Display top performers with highlighting
+        st.subheader("Employee Rankings")
+        st.write("Employees are ranked based on a performance score that considers task completion, task priority, completion time, and timeliness.")
+        
+        # Medal highlighting runs over the Rank column only instead of
+        # every column with a name check per cell
+        st.dataframe(display_df.style.apply(rank_styles, subset=['Rank']))
+        
+        # Display performance insights
+        st.subheader("Performance Insights")
+        
+        # Top performer
+        if not perf_df.empty:
+            top_performer = perf_df.iloc[0]
+            st.write(f"🏆 **Top Performer:** {top_performer['employee_name']} with {top_performer['tasks_completed']} tasks completed")
             
-            st.dataframe(display_df.style.apply(highlight_top_ranks))
+            # Most improved (could be based on recent activity)
+            st.write("### Promotion Recommendations")
+            st.write("Based on the performance metrics, the following employees might be considered for promotion:")
             
-            # Display performance insights
-            st.subheader("Performance Insights")
+            for i, row in perf_df.head(3).iterrows():
+                if row['tasks_completed'] >= 5 and row['on_time_completion_rate'] >= 80:
+                    st.write(f"✅ **{row['employee_name']}** - Completed {row['tasks_completed']} tasks with a {row['on_time_completion_rate']:.1f}% on-time rate")
+    else:
+        st.info("No performance data available yet. Complete some tasks to see the leaderboard.")
+
+@st.fragment
+def render_preferences_tab():
+    """Tab 6: learned and manual employee preferences"""
+    st.header("Employee Preferences & AI Learning")
+    
+    # Display information about AI's learned preferences
+    st.subheader("Personalized Task Matching")
+    st.write("""
+    The AI task matching system learns from task assignments and completions to:
+    
+    1. Understand each employee's skill proficiency
+    2. Track performance metrics for different types of tasks
+    3. Identify which employees excel at specific skills or task types
+    4. Adjust future task assignments based on past performance
+    """)
+    
+    # Show preference learning status
+    if st.session_state.learned_preferences:
+        st.success("✅ The AI has learned employee preferences from task history")
+    else:
+        st.warning("⚠️ Not enough task history to learn preferences. Complete more tasks to enable personalized matching.")
+        if len(st.session_state.assigned_tasks) > 0:
+            st.progress(min(len(st.session_state.assigned_tasks) / 3, 0.99))
+            st.caption(f"Progress: {len(st.session_state.assigned_tasks)}/3 tasks needed")
+    
+    # Skill affinity display
+    if hasattr(st.session_state.task_matcher, 'skill_affinities') and st.session_state.task_matcher.skill_affinities:
+        st.subheader("Employee Skill Affinities")
+        
+        # Select an employee to view their preferences
+        all_employees = st.session_state.employee_manager.get_all_employees()
+        employee_names = all_employees['Name'].tolist()
+        employee_ids = all_employees['ID'].tolist()
+        
+        employee_select = st.selectbox(
+            "Select an employee to view their skill affinities",
+            options=employee_names,
+            index=None,
+            placeholder="Choose an employee..."
+        )
+        
+        if employee_select:
+            employee_id = employee_ids[employee_names.index(employee_select)]
             
-            # Top performer
-            if not perf_df.empty:
-                top_performer = perf_df.iloc[0]
-                st.write(f"🏆 **Top Performer:** {top_performer['employee_name']} with {top_performer['tasks_completed']} tasks completed")
-                
-                # Most improved (could be based on recent activity)
-                st.write("### Promotion Recommendations")
-                st.write("Based on the performance metrics, the following employees might be considered for promotion:")
+            affinities_df = st.session_state.task_matcher.skill_affinities_df
+            if affinities_df is not None and employee_id in affinities_df.index:
+                st.success(f"Showing learned preferences for {employee_select}")
+
+                # One slice of the long-format affinity frame, no dict
+                # unpacking per render
+                skills_df = affinities_df.loc[[employee_id]].reset_index(drop=True).rename(columns={
+                    'skill': 'Skill',
+                    'count': 'Tasks Completed',
+                    'avg_completion_time': 'Average Completion Time (hours)'
+                })
+
+                if not skills_df.empty:
+                    # Sort by task count
+                    skills_df = skills_df.sort_values('Tasks Completed', ascending=False)
+
+                    # Display the dataframe
+                    st.dataframe(skills_df)
+                    
+                    # Show skill affinity visualization
+                    st.subheader("Skill Preference Visualization")
+                    st.bar_chart(skills_df.set_index('Skill')['Tasks Completed'])
+                else:
+                    st.info("No skill affinity data available for this employee yet.")
+            else:
+                st.info("No preferences data available for this employee yet.")
                 
-                for i, row in perf_df.head(3).iterrows():
-                    if row['tasks_completed'] >= 5 and row['on_time_completion_rate'] >= 80:
-                        st.write(f"✅ **{row['employee_name']}** - Completed {row['tasks_completed']} tasks with a {row['on_time_completion_rate']:.1f}% on-time rate")
-        else:
-            st.info("No performance data available yet. Complete some tasks to see the leaderboard.")
-            
-    with tab6:
-        st.header("Employee Preferences & AI Learning")
-        
-        # Display information about AI's learned preferences
-        st.subheader("Personalized Task Matching")
+        # Display manual preference setting section
+        st.subheader("Manual Preference Management")
         st.write("""
-        The AI task matching system learns from task assignments and completions to:
-        
-        1. Understand each employee's skill proficiency
-        2. Track performance metrics for different types of tasks
-        3. Identify which employees excel at specific skills or task types
-        4. Adjust future task assignments based on past performance
+        In addition to AI-learned preferences, you can manually set employee preferences 
+        for specific task types or skills to influence the matching algorithm.
         """)
         
-        # Show preference learning status
-        if st.session_state.learned_preferences:
-            st.success("✅ The AI has learned employee preferences from task history")
-        else:
-            st.warning("⚠️ Not enough task history to learn preferences. Complete more tasks to enable personalized matching.")
-            if len(st.session_state.assigned_tasks) > 0:
-                st.progress(min(len(st.session_state.assigned_tasks) / 3, 0.99))
-                st.caption(f"Progress: {len(st.session_state.assigned_tasks)}/3 tasks needed")
-        
-        # Skill affinity display
-        if hasattr(st.session_state.task_matcher, 'skill_affinities') and st.session_state.task_matcher.skill_affinities:
-            st.subheader("Employee Skill Affinities")
-            
-            # Select an employee to view their preferences
-            all_employees = st.session_state.employee_manager.get_all_employees()
-            employee_names = all_employees['Name'].tolist()
-            employee_ids = all_employees['ID'].tolist()
-            
-            employee_select = st.selectbox(
-                "Select an employee to view their skill affinities",
+        # Form for manually setting preferences
+        with st.form(key="preference_form"):
+            emp_select = st.selectbox(
+                "Employee",
                 options=employee_names,
                 index=None,
-                placeholder="Choose an employee..."
+                placeholder="Select employee...",
+                key="pref_employee"
             )
             
-            if employee_select:
-                employee_id = employee_ids[employee_names.index(employee_select)]
-                
-                if employee_id in st.session_state.task_matcher.skill_affinities:
-                    st.success(f"Showing learned preferences for {employee_select}")
-                    
-                    # Convert skill affinities to DataFrame
-                    skills_data = []
-                    for skill, data in st.session_state.task_matcher.skill_affinities[employee_id].items():
-                        skills_data.append({
-                            'Skill': skill,
-                            'Tasks Completed': data['count'],
-                            'Average Completion Time (hours)': data.get('avg_completion_time', 'N/A')
-                        })
-                    
-                    if skills_data:
-                        skills_df = pd.DataFrame(skills_data)
-                        
-                        # Sort by task count
-                        skills_df = skills_df.sort_values('Tasks Completed', ascending=False)
-                        
-                        # Display the dataframe
-                        st.dataframe(skills_df)
-                        
-                        # Show skill affinity visualization
-                        st.subheader("Skill Preference Visualization")
-                        st.bar_chart(skills_df.set_index('Skill')['Tasks Completed'])
-                    else:
-                        st.info("No skill affinity data available for this employee yet.")
-                else:
-                    st.info("No preferences data available for this employee yet.")
-                    
-            # Display manual preference setting section
-            st.subheader("Manual Preference Management")
-            st.write("""
-            In addition to AI-learned preferences, you can manually set employee preferences 
-            for specific task types or skills to influence the matching algorithm.
-            """)
+            skill_select = st.multiselect(
+                "Preferred Skills",
+                options=st.session_state.all_skills,
+                placeholder="Select skills this employee prefers"
+            )
             
-            # Form for manually setting preferences
-            with st.form(key="preference_form"):
-                emp_select = st.selectbox(
-                    "Employee",
-                    options=employee_names,
-                    index=None,
-                    placeholder="Select employee...",
-                    key="pref_employee"
-                )
-                
-                skill_select = st.multiselect(
-                    "Preferred Skills",
-                    options=st.session_state.employee_manager.get_all_skills(),
-                    placeholder="Select skills this employee prefers"
-                )
-                
-                preference_level = st.slider(
-                    "Preference Level",
-                    min_value=1,
-                    max_value=10,
-                    value=5,
-                    help="How strongly this employee prefers these skills (1 = low, 10 = high)"
-                )
+            preference_level = st.slider(
+                "Preference Level",
+                min_value=1,
+                max_value=10,
+                value=5,
+                help="How strongly this employee prefers these skills (1 = low, 10 = high)"
+            )
+            
+            submit_pref = st.form_submit_button("Save Preferences")
+            
+            if submit_pref and emp_select and skill_select:
+                emp_id = employee_ids[employee_names.index(emp_select)]
                 
-                submit_pref = st.form_submit_button("Save Preferences")
+                # Store in session state
+                if emp_id not in st.session_state.employee_preferences:
+                    st.session_state.employee_preferences[emp_id] = {}
                 
-                if submit_pref and emp_select and skill_select:
-                    emp_id = employee_ids[employee_names.index(emp_select)]
-                    
-                    # Store in session state
-                    if emp_id not in st.session_state.employee_preferences:
-                        st.session_state.employee_preferences[emp_id] = {}
-                    
-                    for skill in skill_select:
-                        st.session_state.employee_preferences[emp_id][skill] = preference_level
-                    
-                    st.success(f"Preferences saved for {emp_select}!")
+                for skill in skill_select:
+                    st.session_state.employee_preferences[emp_id][skill] = preference_level
+                _save_session_snapshot()
+
+                st.success(f"Preferences saved for {emp_select}!")
+
+if st.session_state.data_loaded:
+    # Create tabs for different functionalities
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "Assign Task", 
+        "Search by Skills", 
+        "View All Employees", 
+        "View Assigned Tasks", 
+        "Performance Leaderboard",
+        "Employee Preferences"
+    ])
+    
+    # Try to learn preferences from completed tasks
+    preferences_learned = learn_employee_preferences()
     
+    with tab1:
+        render_assign_tab()
+
+    with tab2:
+        render_skill_search_tab()
+
+    with tab3:
+        render_all_employees_tab()
+
+    with tab4:
+        render_assigned_tasks_tab()
+
+    with tab5:
+        render_leaderboard_tab()
+
+    with tab6:
+        render_preferences_tab()
+
     # Add a footer
     st.markdown("---")
     st.caption("AI Employee Task Assignment System | Developed with Streamlit")
@@ -1,94 +1,137 @@
 import pandas as pd
 import numpy as np
+import json
+import os
 import re
 
+# Append-only log of status changes; replayed on startup so state survives
+# restarts without rewriting the whole CSV per assignment
+JOURNAL_PATH = os.path.join('.state', 'employee_updates.log')
+
 class EmployeeManager:
     """Class to manage employee data and operations"""
-    
+
     def __init__(self, employee_df):
         """Initialize with employee dataframe"""
         self.employee_df = employee_df
         self.original_df = employee_df.copy()  # Keep a copy of the original data
+        self._replaying = False  # True while replay_journal re-applies deltas
+        # Monotonic counter bumped on every status mutation. The manager is
+        # shared by all sessions, so cached views keyed on this counter are
+        # invalidated for everyone when any session changes an employee
+        self.version = 0
         self._process_skills()
         
     def _process_skills(self):
         """Process the Skills column to ensure it's in the correct format"""
         # Make sure Skills column is treated as string
         self.employee_df['Skills'] = self.employee_df['Skills'].astype(str)
-        
+
+        # Pre-split each skills string into a frozenset once, so lookups can
+        # use set operations instead of re-parsing the string per call
+        self.employee_df['SkillsSet'] = (
+            self.employee_df['Skills'].str.split(r'\s*,\s*', regex=True).map(frozenset)
+        )
+
+        # Bitmask index: each skill gets a bit, each employee a row of
+        # uint64 words with their skills' bits set. A multi-skill query is
+        # then a single vectorized (masks & required) == required over all
+        # rows instead of any per-row string or set work
+        skill_sets = self.employee_df['SkillsSet']
+        unique_skills = sorted(set().union(*skill_sets)) if len(skill_sets) else []
+        self._skill_bit = {skill: i for i, skill in enumerate(unique_skills)}
+        n_words = max(1, (len(unique_skills) + 63) // 64)
+        self._skill_masks = np.zeros((len(skill_sets), n_words), dtype=np.uint64)
+        for row, skills in enumerate(skill_sets):
+            for skill in skills:
+                bit = self._skill_bit[skill]
+                self._skill_masks[row, bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+
+        # Positional row per employee ID, so id lookups hash instead of
+        # scanning the ID column
+        self._id_to_idx = {id_: i for i, id_ in enumerate(self.employee_df['ID'])}
+
+        # Lazily filled by the get_all_* accessors; reset here so a
+        # reprocessed roster recomputes them
+        self._all_skills_cache = None
+        self._all_roles_cache = None
+        self._all_experience_levels_cache = None
+
     def get_all_employees(self):
         """Return all employees"""
         return self.employee_df
     
     def get_employee_by_id(self, employee_id):
         """Get an employee by their ID"""
-        employee = self.employee_df[self.employee_df['ID'] == employee_id]
-        if not employee.empty:
-            return employee.iloc[0].to_dict()
+        idx = self._id_to_idx.get(employee_id)
+        if idx is not None:
+            return self.employee_df.iloc[idx].to_dict()
         return None
     
     def get_all_skills(self):
         """Extract and return all unique skills across all employees"""
-        all_skills = set()
-        for skills_str in self.employee_df['Skills']:
-            # Split skills and remove any whitespace
-            if pd.notna(skills_str):
-                skills = [skill.strip() for skill in skills_str.split(',')]
-                all_skills.update(skills)
-        return sorted(list(all_skills))
-    
+        if self._all_skills_cache is None:
+            # The bitmask index already knows every unique skill
+            self._all_skills_cache = sorted(self._skill_bit)
+        return self._all_skills_cache
+
     def get_all_roles(self):
         """Get all unique roles"""
-        return sorted(self.employee_df['Role'].unique().tolist())
-    
+        if self._all_roles_cache is None:
+            self._all_roles_cache = sorted(self.employee_df['Role'].unique().tolist())
+        return self._all_roles_cache
+
     def get_all_experience_levels(self):
         """Get all unique experience levels"""
-        return sorted(self.employee_df['Experience'].unique().tolist())
+        if self._all_experience_levels_cache is None:
+            self._all_experience_levels_cache = sorted(self.employee_df['Experience'].unique().tolist())
+        return self._all_experience_levels_cache
     
     def has_skill(self, employee_id, skill):
         """Check if an employee has a specific skill"""
-        employee = self.get_employee_by_id(employee_id)
-        if employee and 'Skills' in employee:
-            skills = [s.strip() for s in employee['Skills'].split(',')]
-            return skill in skills
-        return False
-    
+        idx = self._id_to_idx.get(employee_id)
+        bit = self._skill_bit.get(skill)
+        if idx is None or bit is None:
+            return False
+        # One bit test against the mask row; no row materialization or
+        # string splitting
+        return bool((self._skill_masks[idx, bit // 64] >> np.uint64(bit % 64)) & np.uint64(1))
+
     def get_employee_skills(self, employee_id):
-        """Get the list of skills for an employee"""
-        employee = self.get_employee_by_id(employee_id)
-        if employee and 'Skills' in employee:
-            return [s.strip() for s in employee['Skills'].split(',')]
+        """Get the sorted list of skills for an employee"""
+        idx = self._id_to_idx.get(employee_id)
+        if idx is not None:
+            return sorted(self.employee_df['SkillsSet'].iloc[idx])
         return []
     
     def find_employees_by_skills(self, required_skills):
         """Find employees who have all the specified skills"""
-        result = []
-        
-        for _, employee in self.employee_df.iterrows():
-            employee_skills = [skill.strip() for skill in employee['Skills'].split(',')]
-            # Check if all required skills are in the employee's skill set
-            if all(skill in employee_skills for skill in required_skills):
-                result.append(employee)
-        
-        if result:
-            return pd.DataFrame(result)
-        else:
-            return pd.DataFrame()
+        required = np.zeros(self._skill_masks.shape[1], dtype=np.uint64)
+        for skill in required_skills:
+            bit = self._skill_bit.get(skill)
+            if bit is None:
+                # Unknown skill: nobody can match
+                return self.employee_df.iloc[0:0]
+            required[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        matches = ((self._skill_masks & required) == required).all(axis=1)
+        return self.employee_df.iloc[np.flatnonzero(matches)]
     
     def get_filtered_employees(self, roles=None, experience_levels=None, availability_status=None):
         """Get employees filtered by role, experience, and availability"""
-        filtered_df = self.employee_df.copy()
-        
+        # Compose the filters as one boolean mask and slice once, instead
+        # of copying the frame and narrowing it filter by filter
+        mask = np.ones(len(self.employee_df), dtype=bool)
+
         if roles:
-            filtered_df = filtered_df[filtered_df['Role'].isin(roles)]
-        
+            mask &= self.employee_df['Role'].isin(roles).to_numpy()
+
         if experience_levels:
-            filtered_df = filtered_df[filtered_df['Experience'].isin(experience_levels)]
-        
+            mask &= self.employee_df['Experience'].isin(experience_levels).to_numpy()
+
         if availability_status:
-            filtered_df = filtered_df[filtered_df['Availability'].isin(availability_status)]
-        
-        return filtered_df
+            mask &= self.employee_df['Availability'].isin(availability_status).to_numpy()
+
+        return self.employee_df.loc[mask]
     
     def get_status_emoji(self, status):
         """Return an emoji representing the employee's status"""
@@ -105,56 +148,137 @@ class EmployeeManager:
     
     def update_employee_availability(self, employee_id, new_status, task_name=None):
         """Update an employee's availability status and current task"""
-        if employee_id in self.employee_df['ID'].values:
-            index = self.employee_df[self.employee_df['ID'] == employee_id].index[0]
-            
-            # Update availability status
-            self.employee_df.at[index, 'Availability'] = new_status
-            
-            # Add status emoji
-            self.employee_df.at[index, 'Status_Emoji'] = self.get_status_emoji(new_status)
-            
-            # Update current tasks if provided
+        if employee_id in self._id_to_idx:
+            index = self.employee_df.index[self._id_to_idx[employee_id]]
+
+            # Collect the row's new values and write them in one loc
+            # assignment instead of a scalar write per column
+            columns = ['Availability', 'Status_Emoji']
+            values = [new_status, self.get_status_emoji(new_status)]
+
             if task_name:
                 current_tasks = self.employee_df.at[index, 'Current_Tasks']
-                
                 if pd.isna(current_tasks) or current_tasks == '':
-                    self.employee_df.at[index, 'Current_Tasks'] = task_name
+                    updated_tasks = task_name
                 else:
-                    self.employee_df.at[index, 'Current_Tasks'] = f"{current_tasks}, {task_name}"
-            
+                    updated_tasks = f"{current_tasks}, {task_name}"
+                columns.append('Current_Tasks')
+                values.append(updated_tasks)
+
+            self.employee_df.loc[index, columns] = values
+            self.version += 1
+
+            self._log_change({
+                'op': 'availability',
+                'employee_id': int(employee_id),
+                'status': new_status,
+                'task_name': task_name or ''
+            })
             return True
         return False
         
     def update_employee_task_status(self, employee_id, task_id, task_status, keep_assigned=True):
         """Update an employee's task status"""
-        if employee_id in self.employee_df['ID'].values:
-            index = self.employee_df[self.employee_df['ID'] == employee_id].index[0]
-            
+        if employee_id in self._id_to_idx:
+            index = self.employee_df.index[self._id_to_idx[employee_id]]
+
             # If task is completed and employee should be freed
             if task_status == 'Completed' and not keep_assigned:
                 # Update employee status based on remaining tasks
                 current_tasks = self.employee_df.at[index, 'Current_Tasks']
                 if pd.isna(current_tasks) or current_tasks == '':
                     # No tasks left, set to Free
-                    self.employee_df.at[index, 'Availability'] = 'Free'
-                    self.employee_df.at[index, 'Status_Emoji'] = self.get_status_emoji('Free')
+                    new_status = 'Free'
                 else:
                     # Still has other tasks, set to Partially Assigned
-                    self.employee_df.at[index, 'Availability'] = 'Partially Assigned'
-                    self.employee_df.at[index, 'Status_Emoji'] = self.get_status_emoji('Partially Assigned')
-            
+                    new_status = 'Partially Assigned'
+                self.employee_df.loc[index, ['Availability', 'Status_Emoji']] = [
+                    new_status, self.get_status_emoji(new_status)
+                ]
+                self.version += 1
+
+            self._log_change({
+                'op': 'task_status',
+                'employee_id': int(employee_id),
+                'task_id': str(task_id),
+                'status': task_status,
+                'keep_assigned': bool(keep_assigned)
+            })
             return True
         return False
     
+    def _log_change(self, record):
+        """Append one status delta to the journal, best-effort.
+
+        Records are JSON objects, one per line, so user-supplied values
+        like task names can contain any characters without breaking the
+        replay parse."""
+        if self._replaying:
+            return
+        try:
+            os.makedirs(os.path.dirname(JOURNAL_PATH), exist_ok=True)
+            with open(JOURNAL_PATH, 'a') as journal:
+                journal.write(json.dumps(record) + '\n')
+        except OSError:
+            pass  # Read-only filesystem etc.; the journal is best-effort
+
+    def replay_journal(self):
+        """Re-apply journaled status changes on top of the loaded dataset.
+
+        Malformed records are skipped and counted rather than silently
+        dropped; returns the number skipped."""
+        if not os.path.exists(JOURNAL_PATH):
+            return 0
+        skipped = 0
+        self._replaying = True
+        try:
+            with open(JOURNAL_PATH) as journal:
+                for line in journal:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        op = record['op']
+                        if op == 'availability':
+                            self.update_employee_availability(
+                                record['employee_id'], record['status'],
+                                record['task_name'] or None)
+                        elif op == 'task_status':
+                            self.update_employee_task_status(
+                                record['employee_id'], record['task_id'],
+                                record['status'], record['keep_assigned'])
+                        else:
+                            skipped += 1
+                    except (KeyError, TypeError, ValueError):
+                        skipped += 1
+        except OSError:
+            pass  # Unreadable journal; keep the loaded state
+        finally:
+            self._replaying = False
+        if skipped:
+            print(f"Warning: skipped {skipped} malformed journal record(s) in {JOURNAL_PATH}")
+        return skipped
+
     def save_data(self, file_path=None):
         """Save the current employee data to a CSV file"""
         if file_path is None:
             file_path = 'employee_positions_dataset.csv'
-        
+
         try:
-            self.employee_df.to_csv(file_path, index=False)
+            # Don't persist derived helper columns
+            self.employee_df.drop(columns=['SkillsSet'], errors='ignore').to_csv(file_path, index=False)
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
+
+    def flush(self, file_path=None):
+        """Write the full dataset out and clear the journal it supersedes"""
+        if self.save_data(file_path):
+            try:
+                os.remove(JOURNAL_PATH)
+            except OSError:
+                pass
+            return True
+        return False
@@ -0,0 +1,116 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+class PerformanceTracker:
+    """Struct-of-arrays store for per-employee performance metrics.
+
+    Metrics live in parallel NumPy arrays indexed by a compact row number
+    per employee, so recording a completion is a few scalar writes and the
+    leaderboard can read whole columns directly instead of rebuilding a
+    DataFrame from a dict of per-employee dicts on every render.
+    """
+
+    def __init__(self, capacity=64):
+        self._row_by_employee = {}
+        self._ids = []
+        self._names = []
+        self._metrics = {
+            'tasks_completed': np.zeros(capacity, np.int32),
+            'high_priority_completed': np.zeros(capacity, np.int32),
+            'medium_priority_completed': np.zeros(capacity, np.int32),
+            'low_priority_completed': np.zeros(capacity, np.int32),
+            'total_completion_time': np.zeros(capacity, np.float64),
+            'on_time_count': np.zeros(capacity, np.int32),
+            'late_count': np.zeros(capacity, np.int32)
+        }
+
+    def __bool__(self):
+        return bool(self._row_by_employee)
+
+    def __len__(self):
+        return len(self._row_by_employee)
+
+    def __contains__(self, employee_id):
+        return employee_id in self._row_by_employee
+
+    def _ensure_row(self, employee_id, employee_name):
+        """Return the row for an employee, allocating one on first use"""
+        row = self._row_by_employee.get(employee_id)
+        if row is None:
+            row = len(self._row_by_employee)
+            if row == len(self._metrics['tasks_completed']):
+                self._grow()
+            self._row_by_employee[employee_id] = row
+            self._ids.append(employee_id)
+            self._names.append(employee_name)
+        return row
+
+    def _grow(self):
+        """Double the backing arrays when the roster outgrows them"""
+        for key, arr in self._metrics.items():
+            self._metrics[key] = np.concatenate([arr, np.zeros(len(arr), arr.dtype)])
+
+    def record_completion(self, employee_id, employee_name, priority, days_taken, on_time):
+        """Record one completed task for an employee"""
+        row = self._ensure_row(employee_id, employee_name)
+        metrics = self._metrics
+
+        metrics['tasks_completed'][row] += 1
+
+        if priority == 'High':
+            metrics['high_priority_completed'][row] += 1
+        elif priority == 'Medium':
+            metrics['medium_priority_completed'][row] += 1
+        else:
+            metrics['low_priority_completed'][row] += 1
+
+        metrics['total_completion_time'][row] += days_taken
+
+        if on_time:
+            metrics['on_time_count'][row] += 1
+        else:
+            metrics['late_count'][row] += 1
+
+    def state_key(self):
+        """Content digest of the recorded metrics, usable as a cache key
+        for derived views.
+
+        Trackers are per-session while Streamlit's data caches are
+        per-process; keying on the content means two trackers only ever
+        share a cache entry when their metrics are identical."""
+        n = len(self._row_by_employee)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(self._ids).encode())
+        digest.update(repr(self._names).encode())
+        for arr in self._metrics.values():
+            digest.update(arr[:n].tobytes())
+        return digest.hexdigest()
+
+    def to_dataframe(self):
+        """Return the metrics as a DataFrame, including the derived
+        average completion time and on-time completion rate"""
+        n = len(self._row_by_employee)
+        metrics = {key: arr[:n] for key, arr in self._metrics.items()}
+
+        tasks = metrics['tasks_completed']
+        avg_time = np.where(tasks > 0, metrics['total_completion_time'] / np.maximum(tasks, 1), 0.0)
+
+        decided = metrics['on_time_count'] + metrics['late_count']
+        on_time_rate = np.where(
+            decided > 0,
+            metrics['on_time_count'] / np.maximum(decided, 1) * 100.0,
+            100.0
+        )
+
+        return pd.DataFrame({
+            'employee_id': self._ids,
+            'employee_name': self._names,
+            'tasks_completed': tasks,
+            'high_priority_completed': metrics['high_priority_completed'],
+            'medium_priority_completed': metrics['medium_priority_completed'],
+            'low_priority_completed': metrics['low_priority_completed'],
+            'avg_completion_time': avg_time,
+            'on_time_completion_rate': on_time_rate
+        })
@@ -1,84 +1,158 @@
 import pandas as pd
 import numpy as np
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Score multipliers for find_best_match, applied as vectorized column maps
+AVAILABILITY_FACTORS = {'Free': 1.0, 'Partially Assigned': 0.7, 'Fully Assigned': 0.3}
+EXPERIENCE_FACTORS = {'Junior': 0.8, 'Mid-Level': 0.9, 'Senior': 1.1, 'Expert': 1.2}
+
+def _factor_array(column, factor_map):
+    """Per-row score multipliers for a column, defaulting to 1.0.
+
+    Categorical columns gather through their integer codes — one small
+    per-category table plus a fancy-index, no per-row hashing."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        factors = np.array([factor_map.get(cat, 1.0) for cat in column.cat.categories])
+        # Missing values carry code -1, which picks up this appended default
+        factors = np.append(factors, 1.0)
+        return factors[column.cat.codes.to_numpy()]
+    return column.map(factor_map).fillna(1.0).to_numpy(dtype=np.float64)
 
 class TaskMatcher:
     """Class to match tasks to employees based on skills, availability, and personalized preferences"""
-    
+
     def __init__(self, employee_manager):
         """Initialize with employee manager"""
+        # Imported here rather than at module top so importing task_matcher
+        # doesn't pay the sklearn init cost until a matcher is built
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         self.employee_manager = employee_manager
         self.vectorizer = TfidfVectorizer(stop_words='english')
         self.employee_preferences = {}
         self.task_history = {}
         self.skill_affinities = {}
+        # Monotonic counter bumped whenever the learned state changes. The
+        # matcher is shared by all sessions, so cached match results keyed
+        # on this counter stay consistent across sessions
+        self.version = 0
+        # Compact learned-preference table: per-employee count vectors
+        # indexed by _skill_to_idx, rebuilt by analyze_task_history
+        self._skill_to_idx = {}
+        self._pref_counts = {}
+        # Long-format (employee_id-indexed) view of the affinities for
+        # display; answering a per-employee query is one .loc slice
+        self.skill_affinities_df = None
+
+        # Fit the vectorizer over the employee corpus once so matching a
+        # task only needs a transform of the incoming description; the
+        # sparse matrix rows align with employee_df positions
+        employee_df = employee_manager.get_all_employees()
+        corpus = (employee_df['Skills'].astype(str) + ' ' + employee_df['Role'].astype(str))
+        try:
+            self._employee_tfidf = self.vectorizer.fit_transform(corpus)
+        except ValueError:
+            self._employee_tfidf = None  # Degenerate corpus; skip text matching
     
     def analyze_task_history(self, task_history, employee_performance):
         """Analyze task history to learn employee preferences and performance patterns"""
         if not task_history:
             return False
-            
-        # Create dictionaries to track employee preferences
-        skill_affinities = {}
-        task_type_preferences = {}
-        completion_speed = {}
-        
-        # Analyze completed tasks
+
+        # Flatten completed tasks into parallel (employee, skill, hours)
+        # records; the aggregation below then runs on whole arrays
+        record_employees = []
+        record_skills = []
+        record_hours = []
         for task in task_history:
             if task.get('status') == 'Completed':
                 employee_id = task.get('employee_id')
-                skills = task.get('required_skills', [])
-                
-                if employee_id not in skill_affinities:
-                    skill_affinities[employee_id] = {}
-                
-                # Track skills the employee has successfully completed
-                for skill in skills:
-                    if skill not in skill_affinities[employee_id]:
-                        skill_affinities[employee_id][skill] = {
-                            'count': 0,
-                            'completion_time': [],
-                            'success_rate': 1.0
-                        }
-                    
-                    skill_affinities[employee_id][skill]['count'] += 1
-                    
-                    # If task has completion time, track it
-                    if 'completion_time' in task and 'timestamp' in task:
-                        time_taken = (task['completion_time'] - task['timestamp']).total_seconds() / (60 * 60)  # hours
-                        skill_affinities[employee_id][skill]['completion_time'].append(time_taken)
-        
-        # Calculate average completion times and success rates
-        for employee_id, skills in skill_affinities.items():
-            for skill, data in skills.items():
-                if data['completion_time']:
-                    data['avg_completion_time'] = sum(data['completion_time']) / len(data['completion_time'])
+                if 'completion_time' in task and 'timestamp' in task:
+                    elapsed = task['completion_time'] - task['timestamp']
+                    # Timestamps may be pandas Timestamps or plain epoch seconds
+                    seconds = elapsed.total_seconds() if hasattr(elapsed, 'total_seconds') else elapsed
+                    hours = seconds / (60 * 60)
                 else:
-                    data['avg_completion_time'] = None
-        
+                    hours = np.nan
+                for skill in task.get('required_skills', []):
+                    record_employees.append(employee_id)
+                    record_skills.append(skill)
+                    record_hours.append(hours)
+
+        if not record_employees:
+            self.skill_affinities = {}
+            self._skill_to_idx = {}
+            self._pref_counts = {}
+            self.skill_affinities_df = None
+            self.version += 1
+            return True
+
+        # Grouped sums via np.add.at over (employee, skill) index pairs
+        unique_employees = sorted(set(record_employees))
+        employee_to_idx = {employee_id: i for i, employee_id in enumerate(unique_employees)}
+        seen_skills = sorted(set(record_skills))
+        self._skill_to_idx = {skill: i for i, skill in enumerate(seen_skills)}
+
+        emp_idx = np.array([employee_to_idx[e] for e in record_employees])
+        skill_idx = np.array([self._skill_to_idx[s] for s in record_skills])
+        hours = np.array(record_hours, dtype=np.float64)
+
+        shape = (len(unique_employees), len(seen_skills))
+        counts = np.zeros(shape)
+        np.add.at(counts, (emp_idx, skill_idx), 1)
+
+        timed = ~np.isnan(hours)
+        time_sums = np.zeros(shape)
+        np.add.at(time_sums, (emp_idx[timed], skill_idx[timed]), hours[timed])
+        timed_counts = np.zeros(shape)
+        np.add.at(timed_counts, (emp_idx[timed], skill_idx[timed]), 1)
+        avg_times = np.divide(time_sums, timed_counts,
+                              out=np.full(shape, np.nan), where=timed_counts > 0)
+
+        # Nested dict kept for the preferences tab; per-employee count
+        # vectors feed get_preference_score directly
+        skill_affinities = {}
+        for ei, si in zip(*np.nonzero(counts)):
+            skill_affinities.setdefault(unique_employees[ei], {})[seen_skills[si]] = {
+                'count': int(counts[ei, si]),
+                'success_rate': 1.0,
+                'avg_completion_time': None if np.isnan(avg_times[ei, si]) else avg_times[ei, si]
+            }
         self.skill_affinities = skill_affinities
+        self._pref_counts = {
+            employee_id: counts[employee_to_idx[employee_id]]
+            for employee_id in unique_employees
+        }
+
+        # Long-format frame over the same nonzero entries, indexed by
+        # employee for one-slice per-employee display queries
+        nonzero_e, nonzero_s = np.nonzero(counts)
+        self.skill_affinities_df = pd.DataFrame({
+            'employee_id': [unique_employees[i] for i in nonzero_e],
+            'skill': [seen_skills[i] for i in nonzero_s],
+            'count': counts[nonzero_e, nonzero_s].astype(np.int64),
+            'avg_completion_time': avg_times[nonzero_e, nonzero_s]
+        }).set_index('employee_id')
+
+        self.version += 1
         return True
     
     def get_preference_score(self, employee_id, required_skills, task_description, manual_preferences=None):
         """Calculate preference score based on historical data and manual preferences"""
         preference_score = 1.0  # Default neutral score
         
-        # Factor 1: Learned preferences from task history
-        if employee_id in self.skill_affinities:
-            skill_matches = 0
-            avg_skill_count = 0
-            
-            for skill in required_skills:
-                if skill in self.skill_affinities[employee_id]:
-                    skill_data = self.skill_affinities[employee_id][skill]
-                    skill_matches += 1
-                    avg_skill_count += skill_data['count']
-            
-            if skill_matches > 0:
-                # Higher preference for skills they've done more frequently
-                preference_score = 1.0 + (avg_skill_count / skill_matches) * 0.1
+        # Factor 1: Learned preferences from task history, as a gather
+        # from the count table built in analyze_task_history
+        counts = self._pref_counts.get(employee_id)
+        if counts is not None:
+            idxs = [self._skill_to_idx[skill] for skill in required_skills
+                    if skill in self._skill_to_idx]
+            if idxs:
+                matched = counts[idxs]
+                matched = matched[matched > 0]
+                if matched.size:
+                    # Higher preference for skills they've done more frequently
+                    preference_score = 1.0 + matched.mean() * 0.1
         
         # Factor 2: Manual preferences set by managers
         if manual_preferences and employee_id in manual_preferences:
@@ -101,57 +175,58 @@ class TaskMatcher:
         
         return preference_score
     
-    def find_best_match(self, task_description, required_skills, consider_preferences=True):
+    def find_best_match(self, task_description, required_skills, consider_preferences=True,
+                        manual_preferences=None):
         """Find the best employee match for a task based on skills, availability, and preferences"""
         # First, filter employees by required skills
         employees_with_skills = self.employee_manager.find_employees_by_skills(required_skills)
-        
+
         if employees_with_skills.empty:
             return None
-        
-        # Create a similarity score for each employee based on their skills
-        scores = []
-        for _, employee in employees_with_skills.iterrows():
-            employee_id = employee['ID']
-            
-            # Calculate skill match score
-            employee_skills = [skill.strip() for skill in employee['Skills'].split(',')]
-            skill_match_ratio = len(set(required_skills).intersection(set(employee_skills))) / len(required_skills)
-            
-            # Adjust score based on availability
-            availability_factor = 1.0  # Free
-            if employee['Availability'] == 'Partially Assigned':
-                availability_factor = 0.7
-            elif employee['Availability'] == 'Fully Assigned':
-                availability_factor = 0.3
-                
-            # Adjust score based on experience level
-            experience_factor = 1.0  # Default
-            if employee['Experience'] == 'Junior':
-                experience_factor = 0.8
-            elif employee['Experience'] == 'Mid-Level':
-                experience_factor = 0.9
-            elif employee['Experience'] == 'Senior':
-                experience_factor = 1.1
-            elif employee['Experience'] == 'Expert':
-                experience_factor = 1.2
-            
-            # Get preference score if enabled
-            preference_factor = 1.0
-            if consider_preferences:
-                preference_factor = self.get_preference_score(employee_id, required_skills, task_description)
-                
-            # Calculate final score with all factors
-            total_score = skill_match_ratio * availability_factor * experience_factor * preference_factor
-            scores.append((employee_id, employee['Name'], total_score))
-        
-        # Sort by score (descending)
-        scores.sort(key=lambda x: x[2], reverse=True)
-        
-        # Return the best match
-        if scores:
-            return scores[0]
-        return None
+
+        # Score all candidates at once with vectorized column maps instead
+        # of a Python loop over rows
+        required = frozenset(required_skills)
+        skill_match_ratio = (
+            employees_with_skills['SkillsSet'].map(lambda s: len(required & s)).to_numpy()
+            / len(required)
+        )
+        availability_factor = _factor_array(employees_with_skills['Availability'],
+                                            AVAILABILITY_FACTORS)
+        experience_factor = _factor_array(employees_with_skills['Experience'],
+                                          EXPERIENCE_FACTORS)
+
+        # Get preference scores if enabled
+        employee_ids = employees_with_skills['ID'].to_numpy()
+        preference_factor = 1.0
+        if consider_preferences:
+            preference_factor = np.array([
+                self.get_preference_score(employee_id, required_skills, task_description,
+                                          manual_preferences=manual_preferences)
+                for employee_id in employee_ids
+            ])
+
+        # Gentle boost for employees whose skills/role text resembles the
+        # task description: one sparse matrix-vector product against the
+        # vectors fitted in __init__, no refitting per call
+        description_factor = 1.0
+        if self._employee_tfidf is not None and task_description:
+            query = self.vectorizer.transform([task_description])
+            similarity = (self._employee_tfidf @ query.T).toarray().ravel()
+            rows = self.employee_manager.get_all_employees().index.get_indexer(
+                employees_with_skills.index
+            )
+            # Similarity is in [0, 1]; cap its influence well below the
+            # skill/availability factors so it only breaks near-ties
+            description_factor = 1.0 + 0.2 * similarity[rows]
+
+        # Calculate final scores with all factors and take the best
+        total_scores = (skill_match_ratio * availability_factor * experience_factor
+                        * preference_factor * description_factor)
+        best = int(np.argmax(total_scores))
+        return (employee_ids[best],
+                employees_with_skills['Name'].iloc[best],
+                float(total_scores[best]))
     
     def assign_task(self, employee_id, task_name, task_description, priority):
         """Assign a task to an employee and update their availability"""
@@ -174,13 +249,9 @@ class TaskMatcher:
             # Cannot assign more tasks
             return False
         
-        # Update employee status
-        success = self.employee_manager.update_employee_availability(
+        # Update employee status; the manager journals the delta, so no
+        # full CSV rewrite happens per assignment (see EmployeeManager.flush
+        # for writing the dataset out in one go)
+        return self.employee_manager.update_employee_availability(
             employee_id, new_status, task_name
         )
-        
-        # Save changes to CSV
-        if success:
-            self.employee_manager.save_data()
-        
-        return success